@@ -5,8 +5,27 @@
 # TODO: Add logging functionality
 # TODO: Redo Events implementation
 # TODO: Remove pyright comments when PySide6 signals and events are properly type hinted.
+from __future__ import annotations
+
+__all__ = (
+    'Client',
+)
+
+from typing import TYPE_CHECKING
+
 from ._version import __version__
 from ._version import __version_info__
 
+if TYPE_CHECKING:
+    from .network import Client
+
 __author__ = 'Cubicpath@Github <cubicpath@pm.me>'
 """Author's information."""
+
+
+def __getattr__(name: str):
+    """Lazily import :py:class:`Client`, so importing the package does not load Qt or the networking stack."""
+    if name == 'Client':
+        from .network import Client
+        return Client
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -4,7 +4,6 @@
 """Entrypoint that is called when using Python's -m switch."""
 
 __all__ = (
-    'exit_code',
     'main',
 )
 
@@ -12,9 +11,6 @@ import sys
 
 from .run import main
 
-# Allow running from import, as __name__ should be __main__
-exit_code: int = main(*sys.argv)
-
-# If imported, do not exit
-if __name__ != '__main__':
-    sys.exit(exit_code)
+# Only run when executed with -m, importing this module should not start the application
+if __name__ == '__main__':
+    sys.exit(main(*sys.argv))
@@ -85,20 +85,22 @@ HI_WPAUTH_PATH: Final[Path] = HI_CONFIG_PATH / '.wpauth'
 HI_PATH_PATTERN: Final[re.Pattern] = re.compile(
     r'[/\\]?(?P<pre_path>[\w\-_.]+[/\\]file[/\\])?'
     r'(?P<dir_name>(?:[\w\-_.]+[/\\])+)'
-    r'(?P<file_name>[\w\-_]*\.\w+)')
+    r'(?P<file_name>[\w\-_]*\.\w+)',
+    flags=re.ASCII)
 """Regex pattern for finding a resource path.
 Finds quoted substrings with at least one folder name and file name (with a file extension).
 """
 
 HI_URL_PATTERN: Final[re.Pattern] = re.compile(
     r'(?i)\b((?:https?:(?:/{1,3}|[a-z0-9%])|'
-    r'[a-z0-9.\-]+[.][a-z]{2,}/)(?:[^\s()<>{}\[\]]+|'
+    r'[a-z0-9.\-]+[.][a-z]{2,}/)(?:[^\s()<>{}\[\]]|'
     r'\([^\s()]*?\([^\s()]+\)[^\s()]*?\)|'
     r'\(\S+?\))+(?:\([^\s()]*?\([^\s()]+\)[^\s()]*?\)|'
     r'\(\S+?\)|[^\s`!()\[\]{};:\'".,<>?«»“”‘’])|'
     r'(?<!@)[a-z0-9]+(?:[.\-][a-z0-9]+)*[.][a-z]{2,}\b/?(?!@))')
 """Regex pattern for finding URLs.
 Derived from https://gist.github.com/gruber/8891611.
+Characters are repeated one at a time, which prevents exponential backtracking.
 """
 
 MARKDOWN_IMG_LINK_PATTERN: Final[re.Pattern] = re.compile(
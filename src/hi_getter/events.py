@@ -13,12 +13,12 @@ __all__ = (
 
 from collections import defaultdict
 from collections.abc import Callable
+from threading import Lock
 from typing import Generic
 from typing import overload
 from typing import TypeAlias
 from typing import TypeVar
-
-from .utils import get_parent_doc
+from weakref import WeakValueDictionary
 
 
 class Event:
@@ -31,10 +31,36 @@ class Event:
 
     __slots__: tuple[str, ...] = ()
 
+    name: str = 'Event'
+    """Name of event.
+
+    Defaults to class name.
+    """
+
+    description: str = __doc__.splitlines()[0] if __doc__ is not None else ''
+    """Short description of the event.
+
+    Defaults to the first line of the nearest type doc in the mro.
+    """
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Set the name and description of the new :py:class:`Event` subclass, unless they are defined by it."""
+        super().__init_subclass__(**kwargs)
+        if 'name' not in cls.__dict__:
+            cls.name = cls.__name__
+        if 'description' not in cls.__dict__:
+            if not (doc := cls.__doc__):
+                # utils pulls in the Qt modules, so only import it for undocumented subclasses
+                from .utils import get_parent_doc
+                doc = get_parent_doc(cls)
+            cls.description = doc.splitlines()[0] if doc is not None else ''
+
     def __repr__(self) -> str:
         """Representation of the :py:class:`Event` with its attributes' values."""
-        values = {attr: getattr(self, attr) for attr in self.__slots__}
-        return f'<"{self.name}" Event {values=}>' if self.__slots__ else f'<Empty {self.name}>'
+        if not self.__slots__:
+            return f'<Empty {self.name}>'
+        values = ', '.join([f'{attr}={getattr(self, attr)!r}' for attr in self.__slots__])
+        return f'<"{self.name}" Event {values}>'
 
     def __rshift__(self, __bus: EventBus, /) -> None:
         """Syntax sugar for __bus.fire(event)."""
@@ -44,32 +70,25 @@ class Event:
         """Right shift if the EventBus.__lshift__ dunder is not working."""
         return self >> __bus
 
-    @property
-    def name(self) -> str:
-        """Name of event.
-
-        Defaults to class name.
-        """
-        return type(self).__name__
-
-    @property
-    def description(self) -> str:
-        """Short description of the event.
-
-        Defaults to the first line of the nearest type doc in the mro.
-        """
-        doc: str | None = self.__doc__
-        # pylint: disable=unidiomatic-typecheck
-        if doc is None and isinstance(self, Event) and type(self) is not Event:
-            doc = get_parent_doc(type(self))
-        return doc.splitlines()[0] if doc is not None else ''
-
 
 _ET = TypeVar('_ET', bound=Event)  # Bound to Event. Can use Event subclass instances in place of Event instances.
 EventPredicate: TypeAlias = Callable[[_ET], bool]
 EventRunnable: TypeAlias = Callable[[_ET], None]
 
 
+def _predicated(e_callable: EventRunnable, e_predicate: EventPredicate) -> EventRunnable:
+    """Wrap an :py:class:`EventRunnable` so that it only runs if the given predicate passes.
+
+    :param e_callable: Callable to run.
+    :param e_predicate: Predicate to validate before running callable.
+    :return: Callable that takes the event as an argument.
+    """
+    def runner(event: Event) -> None:
+        if e_predicate(event):
+            e_callable(event)
+    return runner
+
+
 class _Subscribers(defaultdict[type[Event], list[tuple[
     EventRunnable,          # Callable to run
     EventPredicate | None   # Optional predicate to run callable
@@ -82,8 +101,8 @@ class _Subscribers(defaultdict[type[Event], list[tuple[
     def __repr__(self) -> str:
         """Amount of subscribers for every event, encased in parentheses."""
         repr_: str = ''
-        for event in self:
-            repr_ += f'{event.__name__}[{len(self[event])}], '
+        for event, callable_pairs in self.items():
+            repr_ += f'{event.__name__}[{len(callable_pairs)}], '
         return f'({repr_.rstrip(", ")})'
 
     def add(self,
@@ -93,17 +112,20 @@ class _Subscribers(defaultdict[type[Event], list[tuple[
             ) -> None:
         """Add a callable pair to an Event subscriber list.
 
+        Validation is skipped when running with optimizations enabled (python -O).
+
         :raises TypeError:
             If event is not a subclass of Event.
             If subscriber is not callable.
             If subscriber's predicate is defined but not a callable.
         """
-        if not issubclass(event, Event):
-            raise TypeError(f'event is not subclass to {Event}.')
-        if not callable(callable_pair[0]):
-            raise TypeError('subscriber is not callable.')
-        if callable_pair[1] is not None and not callable(callable_pair[1]):
-            raise TypeError('subscriber predicate is defined but not callable.')
+        if __debug__:
+            if not issubclass(event, Event):
+                raise TypeError(f'event is not subclass to {Event}.')
+            if not callable(callable_pair[0]):
+                raise TypeError('subscriber is not callable.')
+            if callable_pair[1] is not None and not callable(callable_pair[1]):
+                raise TypeError('subscriber predicate is defined but not callable.')
 
         self[event].append(callable_pair)
 
@@ -113,9 +135,11 @@ class _EventBusMeta(type):
 
     Maps :py:class:`EventBus` objects to :py:class:`str` ids
     and allows accessing those ids using subscripts on :py:class:`EventBus`.
+
+    The id map only holds weak references, so a bus is removed once its owner no longer references it.
     """
 
-    _id_bus_map: dict[str, EventBus] = {}
+    _id_bus_map: WeakValueDictionary[str, EventBus] = WeakValueDictionary()
 
     @overload
     def __getitem__(cls, id: type[Event]) -> type[EventBus]:
@@ -133,7 +157,7 @@ class _EventBusMeta(type):
             if issubclass(id, Event):
                 return cls  # type: ignore
 
-        if (bus := cls.get_bus(id)) is None:
+        if (bus := cls._id_bus_map.get(id if id.islower() else id.lower())) is None:
             raise KeyError(f'{cls.__name__} "{id}" does not exist.')
 
         return bus
@@ -153,11 +177,21 @@ class _EventBusMeta(type):
         if bus.id is None:
             bus.id = id
 
-        cls._id_bus_map[id.lower()] = bus
+        cls._id_bus_map[id if id.islower() else id.lower()] = bus
 
     def __delitem__(cls, id: str) -> None:
         """Delete an :py:class:`EventBus` from the bus map."""
-        del cls._id_bus_map[id.lower()]
+        del cls._id_bus_map[id if id.islower() else id.lower()]
+
+    def _register(cls, id: str, bus: EventBus) -> None:
+        """Register a new :py:class:`EventBus` to the bus map.
+
+        :raises KeyError: When a bus with the given id already exists.
+        """
+        if (key := id if id.islower() else id.lower()) in cls._id_bus_map:
+            raise KeyError(f'EventBus id "{id}" is already registered in {type(cls).__name__}')
+
+        cls._id_bus_map[key] = bus
 
     def get_bus(cls, id: str, default: EventBus | None = None) -> EventBus | None:
         """Get bus from class map using the given id, with an optional default value.
@@ -166,7 +200,8 @@ class _EventBusMeta(type):
         :param default: Default value if id resolves to None.
         :return: EventBus mapped to given id.
         """
-        return cls._id_bus_map.get(id.lower(), default)
+        # Skip building a new lowercase string if the id already is lowercase
+        return cls._id_bus_map.get(id if id.islower() else id.lower(), default)
 
 
 class EventBus(Generic[_ET], metaclass=_EventBusMeta):
@@ -197,6 +232,8 @@ class EventBus(Generic[_ET], metaclass=_EventBusMeta):
             Event() << EventBus['foo']
     """
 
+    __slots__ = ('__weakref__', '_resolved', '_subscribers', '_subscribers_lock', 'id')
+
     def __init__(self, __id: str | None = None, /) -> None:
         """Create a new :py:class:`EventBus` object with a unique id.
 
@@ -205,14 +242,14 @@ class EventBus(Generic[_ET], metaclass=_EventBusMeta):
         :param __id: id to register this instance as.
         :raises KeyError: When a bus with the given id already exists.
         """
-        if __id is not None and type(self).get_bus(__id) is not None:
-            raise KeyError(f'EventBus id "{__id}" is already registered in {type(type(self)).__name__}')
-
         self.id: str | None = __id
         self._subscribers: _Subscribers = _Subscribers()
+        self._subscribers_lock: Lock = Lock()
+        # Subscribers of every Event type, including parent types. Replaced when subscribers change
+        self._resolved: dict[type[_ET], tuple[EventRunnable, ...]] = {}
 
         if __id is not None:
-            type(self)[__id] = self
+            type(self)._register(__id, self)
 
     def __lshift__(self, __event: _ET | type[_ET], /) -> None:
         """Syntax sugar for self.fire(event)."""
@@ -222,6 +259,21 @@ class EventBus(Generic[_ET], metaclass=_EventBusMeta):
         """Representation of the :py:class:`EventBus` with its id and :py:class:`_Subscribers`."""
         return f'<{type(self).__name__} id={self.id!r}; Subscribers={self._subscribers!r}>'
 
+    def _resolve(self, event_type: type[_ET]) -> tuple[EventRunnable, ...]:
+        """Collect the callables of an :py:class:`Event` type and its parents, in subscription order.
+
+        Callables with a predicate are wrapped to only run when their predicate passes.
+        Must be called while holding the subscribers lock.
+
+        :param event_type: Event type to collect callables for.
+        """
+        mro: frozenset[type] = frozenset(event_type.__mro__)
+        return tuple(
+            e_callable if e_predicate is None else _predicated(e_callable, e_predicate)
+            for subscribed_type, callable_pairs in self._subscribers.items() if subscribed_type in mro
+            for e_callable, e_predicate in callable_pairs
+        )
+
     def clear(self, event: type[_ET] | None = None) -> None:
         """Clear event _subscribers of a given type.
 
@@ -229,10 +281,13 @@ class EventBus(Generic[_ET], metaclass=_EventBusMeta):
 
         :param event: Event type to clear.
         """
-        if event is None:
-            self._subscribers.clear()
-        else:
-            self._subscribers.pop(event)
+        with self._subscribers_lock:
+            if event is None:
+                self._subscribers.clear()
+            else:
+                self._subscribers.pop(event, None)
+
+            self._resolved = {}
 
     def fire(self, event: _ET | type[_ET]) -> None:
         """Fire all :py:class:`Callables` subscribed to the :py:class:`Event`'s :py:class:`type`.
@@ -240,23 +295,26 @@ class EventBus(Generic[_ET], metaclass=_EventBusMeta):
         :py:class:`Event` subclasses call their parent's callables as well.
         Ex: ChildEvent will fire ParentEvent, but ParentEvent will not fire ChildEvent.
 
-        If event is a :py:class:`type`, it is instantiated with no arguments.
+        If event is a :py:class:`type`, it is instantiated with no arguments when it has any subscribers.
 
         :param event: Event object passed to callables as an argument.
         """
-        # Transform Event types to their default instances
-        if isinstance(event, type) and issubclass(event, Event):
-            event = event()
+        # Check for the common instance case first
+        is_type: bool = not isinstance(event, Event) and isinstance(event, type) and issubclass(event, Event)
+
+        # Resolve the current and parent event callables once per Event type.
+        # Resolved subscribers are read without locking, as they are never mutated after being published
+        event_type: type[_ET] = event if is_type else type(event)  # type: ignore
+        if (subscribers := self._resolved.get(event_type)) is None:
+            with self._subscribers_lock:
+                subscribers = self._resolved[event_type] = self._resolve(event_type)
 
-        # Run all current and parent event callables
-        for event_type in self._subscribers:
-            if isinstance(event, event_type):
-                for e_callable_pair in self._subscribers[event_type]:
-                    # Check predicate if one is given
-                    if e_callable_pair[1] is None or e_callable_pair[1](event):
+        # Transform Event types to their default instances, only if there is a subscriber to receive it
+        if is_type and subscribers:
+            event = event()  # type: ignore
 
-                        # Finally, call
-                        e_callable_pair[0](event)
+        for e_callable in subscribers:
+            e_callable(event)
 
     # pylint: disable=useless-param-doc
     def subscribe(self,
@@ -274,4 +332,6 @@ class EventBus(Generic[_ET], metaclass=_EventBusMeta):
         :raises TypeError: If the given arguments are not valid.
         """
         callable_pair = (__callable, event_predicate)
-        self._subscribers.add(event, callable_pair)
+        with self._subscribers_lock:
+            self._subscribers.add(event, callable_pair)
+            self._resolved = {}
@@ -35,6 +35,8 @@ class ExceptionEvent(Event):
 class ExceptionHook:
     """Object that intercepts :py:class:`Exception`'s and handles them."""
 
+    __slots__ = ('__old_hook', 'event_bus')
+
     def __init__(self, bus_id: str | None = 'exceptions'):
         """Initialize the :py:class:`ExceptionHook` for use in a context manager."""
         self.__old_hook: ExceptHookCallable = sys.excepthook
@@ -46,7 +48,7 @@ class ExceptionHook:
         if not issubclass(type_, Exception):
             return self.old_hook(type_, exception, traceback)
 
-        self.event_bus << ExceptionEvent(exception, traceback)
+        self.event_bus.fire(ExceptionEvent(exception, traceback))
 
     def __repr__(self) -> str:
         """Representation of the :py:class:`ExceptionHook` with the old hook."""
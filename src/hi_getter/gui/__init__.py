@@ -3,10 +3,14 @@
 ###################################################################################################
 """Relative package containing all things handling GUI elements."""
 # TODO: Redo ExceptionLogger implementation, with more functionality given to ExceptionReporter.
+from __future__ import annotations
 
 __all__ = (
-    'app',
     'AppWindow',
+    'CacheExplorer',
+    'CacheIndexContextMenu',
+    'ChangelogViewer',
+    'ColumnContextMenu',
     'ExceptionLogger',
     'ExceptionReporter',
     'ExternalTextBrowser',
@@ -24,24 +28,68 @@ __all__ = (
     'tr'
 )
 
-from .aliases import app
-from .aliases import tr
-from .app import GetterApp
-from .app import Theme
-from .menus import CacheIndexContextMenu
-from .menus import ColumnContextMenu
-from .menus import FileContextMenu
-from .menus import HelpContextMenu
-from .menus import ToolsContextMenu
-from .widgets import CacheExplorer
-from .widgets import ExceptionLogger
-from .widgets import ExternalTextBrowser
-from .widgets import HistoryComboBox
-from .widgets import PasteLineEdit
-from .windows import AppWindow
-from .windows import ChangelogViewer
-from .windows import ExceptionReporter
-from .windows import LicenseViewer
-from .windows import ReadmeViewer
-from .windows import ScanSelectorDialog
-from .windows import SettingsWindow
+from importlib import import_module
+from typing import Any
+from typing import Final
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .aliases import tr
+    from .app import GetterApp
+    from .app import Theme
+    from .menus import CacheIndexContextMenu
+    from .menus import ColumnContextMenu
+    from .menus import FileContextMenu
+    from .menus import HelpContextMenu
+    from .menus import ToolsContextMenu
+    from .widgets import CacheExplorer
+    from .widgets import ExceptionLogger
+    from .widgets import ExternalTextBrowser
+    from .widgets import HistoryComboBox
+    from .widgets import PasteLineEdit
+    from .windows import AppWindow
+    from .windows import ChangelogViewer
+    from .windows import ExceptionReporter
+    from .windows import LicenseViewer
+    from .windows import ReadmeViewer
+    from .windows import ScanSelectorDialog
+    from .windows import SettingsWindow
+
+_LAZY_IMPORTS: Final[dict[str, str]] = {
+    'tr': '.aliases',
+    'GetterApp': '.app',
+    'Theme': '.app',
+    'CacheIndexContextMenu': '.menus',
+    'ColumnContextMenu': '.menus',
+    'FileContextMenu': '.menus',
+    'HelpContextMenu': '.menus',
+    'ToolsContextMenu': '.menus',
+    'CacheExplorer': '.widgets',
+    'ExceptionLogger': '.widgets',
+    'ExternalTextBrowser': '.widgets',
+    'HistoryComboBox': '.widgets',
+    'PasteLineEdit': '.widgets',
+    'AppWindow': '.windows',
+    'ChangelogViewer': '.windows',
+    'ExceptionReporter': '.windows',
+    'LicenseViewer': '.windows',
+    'ReadmeViewer': '.windows',
+    'ScanSelectorDialog': '.windows',
+    'SettingsWindow': '.windows',
+}
+"""Mapping of every lazily imported name to the submodule it is defined in."""
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import GUI classes, so importing this package does not load every Qt window and widget module."""
+    if (module := _LAZY_IMPORTS.get(name)) is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value  # Cache the value, so __getattr__ is only called once per name
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported names along with the already loaded globals."""
+    return sorted(set(__all__) | globals().keys())
@@ -10,13 +10,21 @@ __all__ = (
 )
 
 from typing import Any
+from typing import TYPE_CHECKING
 
-from .app import GetterApp
+if TYPE_CHECKING:
+    from .app import GetterApp
+
+_app_type: type[GetterApp] | None = None  # Imported on first use, as the app module loads the entire application
 
 
 def app() -> GetterApp:
     """Return :py:class:`GetterApp`.instance()."""
-    return GetterApp.instance()
+    global _app_type  # pylint: disable=global-statement
+    if _app_type is None:
+        from .app import GetterApp
+        _app_type = GetterApp
+    return _app_type.instance()
 
 
 def tr(key: str, *args: Any, **kwargs: Any) -> str:
@@ -31,7 +31,7 @@ def file_to_clipboard(file_path: Path):
 
     :param file_path: File path to read from.
     """
-    if str(file_path).endswith(tuple(SUPPORTED_IMAGE_EXTENSIONS)):
+    if file_path.suffix.lstrip('.').lower() in SUPPORTED_IMAGE_EXTENSIONS:
         pixmap = QPixmap()
         pixmap.loadFromData(file_path.read_bytes())
         app().clipboard().setImage(pixmap.toImage())
@@ -47,12 +47,14 @@ class CacheIndexContextMenu(QMenu):
         """Create a new :py:class:`CacheIndexContextMenu` for the given parent and index."""
         super().__init__(parent)
 
+        application = app()
+
         file_path = Path(parent.model().filePath(index))
         if not (dir_path := file_path).is_dir():
             dir_path = file_path.parent
 
         try:
-            os_path = app().client.to_get_path(file_path)
+            os_path = application.client.to_get_path(file_path)
         except (IndexError, ValueError):
             os_path = ''
 
@@ -84,8 +86,8 @@ class CacheIndexContextMenu(QMenu):
 
             (open_in_explorer := QAction(self)): {
                 'text': tr('gui.menus.cached_file.view_in_explorer'),
-                'icon': (app().get_theme_icon('dialog_open') or
-                         app().icon_store['folder']),
+                'icon': (application.get_theme_icon('dialog_open') or
+                         application.icon_store['folder']),
                 'triggered': DeferredCallable(
                     QDesktopServices.openUrl,
                     QUrl(dir_path.as_uri())
@@ -122,13 +124,13 @@ class CacheIndexContextMenu(QMenu):
 
             (copy_full_path := QAction(self)): {
                 'text': tr('gui.menus.cached_file.copy_full_path'),
-                'triggered': DeferredCallable(app().clipboard().setText, str(file_path))
+                'triggered': DeferredCallable(application.clipboard().setText, str(file_path))
             },
 
             (copy_endpoint_path := QAction(self)): {
                 'disabled': not os_path,
                 'text': tr('gui.menus.cached_file.copy_endpoint_path'),
-                'triggered': DeferredCallable(app().clipboard().setText, os_path)
+                'triggered': DeferredCallable(application.clipboard().setText, os_path)
             },
 
             (copy_contents := QAction(self)): {
@@ -139,7 +141,7 @@ class CacheIndexContextMenu(QMenu):
 
             (delete := QAction(self)): {
                 'text': tr('gui.menus.cached_file.delete', 'Folder' if file_path.is_dir() else 'File'),
-                'icon': (app().get_theme_icon('dialog_cancel') or
+                'icon': (application.get_theme_icon('dialog_cancel') or
                          self.style().standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton)),
                 'triggered': DeferredCallable(parent.delete_index, index)
             },
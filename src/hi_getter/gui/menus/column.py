@@ -27,15 +27,17 @@ class ColumnContextMenu(QMenu):
         """
         super().__init__(parent)
 
+        application = app()
+
         disabled_indices = set() if disabled_indices is None else disabled_indices
 
         icons = (
             # Not Hidden
-            app().get_theme_icon('checkbox_checked') or
+            application.get_theme_icon('checkbox_checked') or
             self.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton),
 
             # Hidden
-            app().get_theme_icon('checkbox_unchecked') or
+            application.get_theme_icon('checkbox_unchecked') or
             self.style().standardIcon(QStyle.StandardPixmap.SP_DialogCancelButton),
         )
 
@@ -89,13 +89,15 @@ class FileContextMenu(QMenu):
         """Create a new :py:class:`FileContextMenu`."""
         super().__init__(parent)
 
+        application = app()
+
         cached_requests = HI_CACHE_PATH / 'cached_requests'
 
         init_objects({
             (open_explorer := QAction(self)): {
                 'text': tr('gui.menus.file.open'),
-                'icon': (app().get_theme_icon('dialog_open') or
-                         app().icon_store['folder']),
+                'icon': (application.get_theme_icon('dialog_open') or
+                         application.icon_store['folder']),
                 'triggered': DeferredCallable(
                     QDesktopServices.openUrl,
                     QUrl(HI_CACHE_PATH.as_uri())
@@ -106,14 +108,14 @@ class FileContextMenu(QMenu):
                 # DISABLED IF EMPTY DIRECTORY
                 'disabled': not any(HI_CACHE_PATH.iterdir()),
                 'text': tr('gui.menus.file.flush'),
-                'icon': (app().get_theme_icon('dialog_discard') or
+                'icon': (application.get_theme_icon('dialog_discard') or
                          self.style().standardIcon(QStyle.StandardPixmap.SP_DialogDiscardButton)),
                 'triggered': self.flush_cache
             },
 
             (import_from := QAction(self)): {
                 'text': tr('gui.menus.file.import'),
-                'icon': app().icon_store['import'],
+                'icon': application.icon_store['import'],
                 'triggered': import_data
             },
 
@@ -122,7 +124,7 @@ class FileContextMenu(QMenu):
                 'disabled': (True if (cached_requests.is_dir() and not any(cached_requests.iterdir()))
                              else not cached_requests.is_dir()),
                 'text': tr('gui.menus.file.export'),
-                'icon': app().icon_store['export'],
+                'icon': application.icon_store['export'],
                 'triggered': export_data
             }
         })
@@ -44,10 +44,12 @@ class HelpContextMenu(QMenu):
         """Create a new :py:class:`HelpContextMenu`."""
         super().__init__(parent)
 
+        application = app()
+
         init_objects({
             (github_view := QAction(self)): {
                 'text': tr('gui.menus.help.github'),
-                'icon': app().icon_store['github'],
+                'icon': application.icon_store['github'],
                 'triggered': DeferredCallable(
                     QDesktopServices.openUrl,
                     QUrl('https://github.com/Cubicpath/HaloInfiniteGetter/')
@@ -56,7 +58,7 @@ class HelpContextMenu(QMenu):
 
             (create_issue := QAction(self)): {
                 'text': tr('gui.menus.help.issue'),
-                'icon': app().icon_store['github'],
+                'icon': application.icon_store['github'],
                 'triggered': DeferredCallable(
                     QDesktopServices.openUrl,
                     QUrl('https://github.com/Cubicpath/HaloInfiniteGetter/issues/new/choose')
@@ -65,15 +67,15 @@ class HelpContextMenu(QMenu):
 
             (about_view := QAction(self)): {
                 'text': tr('gui.menus.help.about'),
-                'icon': (app().get_theme_icon('message_question') or
-                         app().icon_store['about']),
+                'icon': (application.get_theme_icon('message_question') or
+                         application.icon_store['about']),
                 'triggered': self.open_about
             },
 
             (about_qt_view := QAction(self)): {
                 'text': tr('gui.menus.help.about_qt'),
-                'icon': (app().get_theme_icon('message_question') or
-                         app().icon_store['about']),
+                'icon': (application.get_theme_icon('message_question') or
+                         application.icon_store['about']),
                 'triggered': DeferredCallable(
                     QMessageBox(self).aboutQt, self, tr('about.qt.title')
                 )
@@ -81,20 +83,20 @@ class HelpContextMenu(QMenu):
 
             (changelog := QAction(self)): {
                 'text': tr('gui.menus.help.changelog'),
-                'icon': (app().get_theme_icon('message_information') or
+                'icon': (application.get_theme_icon('message_information') or
                          self.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton)),
                 'triggered': lambda: app().windows['changelog_viewer'].show()
             },
 
             (license_view := QAction(self)): {
                 'text': tr('gui.menus.help.license'),
-                'icon': app().icon_store['copyright'],
+                'icon': application.icon_store['copyright'],
                 'triggered': lambda: app().windows['license_viewer'].show()
             },
 
             (readme := QAction(self)): {
                 'text': tr('gui.menus.help.readme'),
-                'icon': (app().get_theme_icon('message_information') or
+                'icon': (application.get_theme_icon('message_information') or
                          self.style().standardIcon(QStyle.StandardPixmap.SP_DialogApplyButton)),
                 'triggered': lambda: app().windows['readme_viewer'].show()
             }
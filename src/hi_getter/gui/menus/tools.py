@@ -64,12 +64,14 @@ class ToolsContextMenu(QMenu):
         """Create a new :py:class:`ToolsContextMenu`."""
         super().__init__(parent)
 
+        application = app()
+
         # noinspection PyUnresolvedReferences
         init_objects({
             (scan_selector := QAction(self)): {
                 'text': tr('gui.menus.tools.scan_selector_dialog'),
                 'icon': self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogContentsView),
-                'triggered': app().windows['scan_selector'].show
+                'triggered': application.windows['scan_selector'].show
             },
 
             (shortcut_tool := QAction(self)): {
@@ -80,8 +82,8 @@ class ToolsContextMenu(QMenu):
 
             (exception_reporter := QAction(self)): {
                 'text': tr('gui.menus.tools.exception_reporter'),
-                'icon': app().windows['app'].exception_reporter.logger.icon(),  # type: ignore
-                'triggered': app().windows['app'].exception_reporter.show       # type: ignore
+                'icon': application.windows['app'].exception_reporter.logger.icon(),  # type: ignore
+                'triggered': application.windows['app'].exception_reporter.show       # type: ignore
             }
         })
 
@@ -9,6 +9,7 @@ __all__ = (
     'LoggedException',
 )
 
+from bisect import bisect_left
 from datetime import datetime
 from types import TracebackType
 from typing import NamedTuple
@@ -66,10 +67,10 @@ class ExceptionLogger(QPushButton):
         """Update the exception log and change set the max level."""
         level = 1 if isinstance(event.exception, Warning) and self.severity < 1 else 2
 
-        self.severity = max(self.severity, level)
-
-        self.exception_log.append(LoggedException(level, event.exception, event.traceback, datetime.now()))
-        self.sort_exceptions()
+        # Insert before any exceptions of the same severity, keeping the log sorted without re-sorting it
+        index: int = bisect_left(self.exception_log, -level, key=lambda x: -x.severity)
+        self.exception_log.insert(index, LoggedException(level, event.exception, event.traceback, datetime.now()))
+        self.severity = self.exception_log[0].severity
 
         logged = len(self.exception_log)
         self.setText(f'({logged})' if logged < 10 else '(9+)')
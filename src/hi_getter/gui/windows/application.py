@@ -173,6 +173,7 @@ class AppWindow(Singleton, QMainWindow):
     # noinspection PyTypeChecker
     def _init_ui(self) -> None:
         """Initialize the UI, including Layouts and widgets."""
+        application = app()
 
         def setup_detached_window(id_: str, frame: QFrame, handler: Callable, title: str | None = None) -> QMainWindow:
             """Set up a detached window, with the layout represented as a :py:class:`QFrame`.
@@ -269,7 +270,7 @@ class AppWindow(Singleton, QMainWindow):
             if not Path(file_path).is_file():
                 return
 
-            if file_path.endswith(tuple(SUPPORTED_IMAGE_EXTENSIONS)):
+            if file_path.rpartition('.')[2].lower() in SUPPORTED_IMAGE_EXTENSIONS:
                 self.update_image(file_path, Path(file_path).read_bytes())
             else:
                 self.update_text(file_path, Path(file_path).read_text(encoding='utf8'))
@@ -317,7 +318,7 @@ class AppWindow(Singleton, QMainWindow):
             self.copy_picture: {
                 'disabled': True,
                 'size': {'maximum': (160, None), 'minimum': (80, None)},
-                'clicked': DeferredCallable(app().clipboard().setPixmap, lambda: self.current_image)
+                'clicked': DeferredCallable(application.clipboard().setPixmap, lambda: self.current_image)
             },
             self.clear_text: {
                 'disabled': True,
@@ -327,7 +328,7 @@ class AppWindow(Singleton, QMainWindow):
             self.copy_text: {
                 'disabled': True,
                 'size': {'maximum': (160, None), 'minimum': (80, None)},
-                'clicked': DeferredCallable(app().clipboard().setText, self.text_output.toPlainText)
+                'clicked': DeferredCallable(application.clipboard().setText, self.text_output.toPlainText)
             },
             (get_button := QPushButton(self)): {
                 'size': {'maximum': (40, None)},
@@ -346,11 +347,11 @@ class AppWindow(Singleton, QMainWindow):
                 'returnPressed': self.use_input
             },
             (subdomain_field := PasteLineEdit(self)): {
-                'text': app().client.sub_host, 'disabled': True,
+                'text': application.client.sub_host, 'disabled': True,
                 'size': {'fixed': (125, None)}
             },
             (root_folder_field := PasteLineEdit(self)): {
-                'text': app().client.parent_path, 'disabled': True,
+                'text': application.client.parent_path, 'disabled': True,
                 'size': {'fixed': (28, None)}
             },
 
@@ -367,12 +368,12 @@ class AppWindow(Singleton, QMainWindow):
             },
             self.text_output: {
                 'disabled': True, 'size': {'minimum': (None, 28)},
-                'lineWrapMode': QTextEdit.LineWrapMode(app().settings['gui/text_output/line_wrap_mode']),
+                'lineWrapMode': QTextEdit.LineWrapMode(application.settings['gui/text_output/line_wrap_mode']),
                 'openLinks': False, 'anchorClicked': self.navigate_to
             }
         })
 
-        app().init_translations({
+        application.init_translations({
             # Labels
             self.image_size_label.setText: 'gui.outputs.image.label_empty',
             self.text_size_label.setText: 'gui.outputs.text.label_empty',
@@ -9,7 +9,6 @@ __all__ = (
 )
 
 from importlib.metadata import metadata
-from typing import Final
 
 from PySide6.QtCore import *
 from PySide6.QtGui import *
@@ -26,8 +25,6 @@ from ..widgets import ExternalTextBrowser
 class ReadmeViewer(QWidget):
     """Widget that formats and shows the project's README.md, stored in the projects 'Description' metadata tag."""
 
-    README_TEXT: Final[str] = metadata(HI_PACKAGE_NAME)['Description']
-
     def __init__(self, *args, **kwargs) -> None:
         """Create a new :py:class:`ReadmeViewer` and initialize UI."""
         super().__init__(*args, **kwargs)
@@ -66,4 +63,5 @@ class ReadmeViewer(QWidget):
             }
         })
 
-        self.readme_viewer.set_hot_reloadable_text(self.README_TEXT, 'markdown')
+        # Package metadata is read here instead of at import, as it has to search for the installed distribution
+        self.readme_viewer.set_hot_reloadable_text(metadata(HI_PACKAGE_NAME)['Description'], 'markdown')
@@ -8,7 +8,6 @@ __all__ = (
     'ScanSelectorDialog',
 )
 
-import json
 from pathlib import Path
 from typing import Any
 
@@ -19,6 +18,7 @@ from PySide6.QtWidgets import *
 from ...constants import *
 from ...utils import init_layouts
 from ...utils import init_objects
+from ...utils import load_json
 from ..aliases import app
 from ..aliases import tr
 
@@ -118,7 +118,7 @@ class ScanSelectorDialog(QWidget):
         try:
             for i, path in enumerate(paths):
                 path = path.expanduser().resolve(strict=True)
-                data: dict[str, Any] = json.loads(path.read_bytes())
+                data: dict[str, Any] = load_json(path.read_bytes())
 
                 if i == len(paths) - 1:
                     app().client.finishedSearch.connect(app().client._on_finished_search)
@@ -12,6 +12,7 @@ __all__ = (
     'Translator',
 )
 
+import functools
 import json
 import re
 from collections.abc import Iterator
@@ -103,6 +104,12 @@ def format_value(
     return value
 
 
+@functools.lru_cache(maxsize=256)
+def _match_tag(tag: str) -> re.Match | None:
+    """Match a language tag against ``RFC_5646_PATTERN``, caching the result as only a few tags are ever used."""
+    return RFC_5646_PATTERN.match(tag)
+
+
 def matched_subtags(tag: str) -> dict[str, str]:
     """Match all subtags in a valid language tag and returns a dictionary representation.
 
@@ -110,7 +117,7 @@ def matched_subtags(tag: str) -> dict[str, str]:
     :return: Dictionary containing subtags and their values.
     :raises ValueError: If ``tag`` is not a valid language tag.
     """
-    if (match := RFC_5646_PATTERN.match(tag)) is not None:
+    if (match := _match_tag(tag)) is not None:
         return match.groupdict()
     raise ValueError(f'"{tag}" is not a valid language tag (RFC 5646).')
 
@@ -9,9 +9,11 @@ __all__ = (
     'DeferredCallable',
     'DistributedCallable',
     'Singleton',
+    'TokenBucket',
 )
 
 import sys
+import time
 import weakref
 from abc import ABC
 from abc import abstractmethod
@@ -239,10 +241,9 @@ class DeferredCallable(_AbstractCallable, Generic[_PT, _KT]):
         :param val: Value to evaluate.
         :return: The called value, if callable.
         """
-        return val() if callable(val) and (
-            (isinstance(val, type) and self.call_types) or
-            (not isinstance(val, type) and self.call_funcs)
-        ) else val
+        if not callable(val):
+            return val
+        return val() if (self.call_types if isinstance(val, type) else self.call_funcs) else val
 
     def run(self, *args: Any, **kwargs: Any) -> Any:
         """Run the stored :py:class:`Callable`.
@@ -253,13 +254,20 @@ class DeferredCallable(_AbstractCallable, Generic[_PT, _KT]):
         :param kwargs: keyword arguments to pass callable.
         :raises RuntimeError: Internal callable was not expecting the amount of positional arguments given.
         """
-        # Add additional arguments from local args
-        args = self.args + args[:self._extra_pos_args]  # Trim all arguments that are not expected
-        kwargs |= self.kwargs
+        # Add additional arguments from local args, trimming all arguments that are not expected
+        args = self.args + args[:self._extra_pos_args] if args and self._extra_pos_args else self.args
+
+        if not kwargs:
+            kwargs = self.kwargs  # Never mutated below, evaluation creates a new dict
+        elif self.kwargs:
+            kwargs |= self.kwargs
 
-        # Evaluate all callable arguments
-        args = tuple(self._evaluate_value(arg) for arg in args)
-        kwargs = {key: self._evaluate_value(val) for key, val in kwargs.items()}
+        # Evaluate all callable arguments, skipping the evaluation entirely if none are callable or called
+        if self.call_funcs or self.call_types:
+            if any(callable(arg) for arg in args):
+                args = tuple(self._evaluate_value(arg) for arg in args)
+            if any(callable(val) for val in kwargs.values()):
+                kwargs = {key: self._evaluate_value(val) for key, val in kwargs.items()}
 
         try:
             return self.callable(*args, **kwargs)
@@ -504,3 +512,51 @@ class Singleton:
 
 
 _SingletonT = TypeVar('_SingletonT', bound=Singleton)
+
+
+class TokenBucket:
+    """A rate limiter which allows bursts of up to ``capacity`` actions, refilled at ``rate`` tokens per second.
+
+    Tokens are reserved even when none are available, so waiting callers are spaced out instead of
+    all retrying at once. A non-positive ``rate`` disables rate limiting. ex::
+
+        bucket = TokenBucket(rate=2)
+        if (delay := bucket.acquire()):
+            ...  # Act in ``delay`` seconds, without acquiring again
+    """
+
+    __slots__ = ('capacity', 'rate', '_last_refill', '_tokens')
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        """Create a new full :py:class:`TokenBucket`.
+
+        :param rate: Amount of tokens regained every second.
+        :param capacity: Maximum amount of stored tokens. Defaults to one second's worth of tokens, with a minimum of 1.
+        """
+        self.rate: float = rate
+        self.capacity: float = max(rate, 1.0) if capacity is None else capacity
+        self._last_refill: float = time.monotonic()
+        self._tokens: float = self.capacity
+
+    def __repr__(self) -> str:
+        """Representation of the :py:class:`TokenBucket` with its rate and capacity."""
+        return f'<{type(self).__name__} rate={self.rate}/s capacity={self.capacity}>'
+
+    def acquire(self) -> float:
+        """Take a token, reserving the next one if none are available.
+
+        :return: 0 if a token was available, else the amount of seconds until the reserved token is available.
+        """
+        if self.rate <= 0:
+            return 0.0
+
+        now: float = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+        # Tokens go below zero while reserved, so each reservation waits for the ones before it
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+
+        return -self._tokens / self.rate
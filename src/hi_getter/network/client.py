@@ -9,12 +9,16 @@ __all__ = (
     'Client',
 )
 
+import atexit
 import json
+import math
 import os
+from collections import deque
 from collections.abc import Callable
 from datetime import datetime
 from datetime import timezone
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from typing import Final
 from urllib.parse import quote
@@ -24,16 +28,49 @@ from PySide6.QtCore import *
 from ..constants import *
 from ..models import CaseInsensitiveDict
 from ..models import DeferredCallable
-from ..utils import dump_data
+from ..models import TokenBucket
 from ..utils import decode_url
-from ..utils import guess_json_utf
+from ..utils import dump_data
 from ..utils import hide_windows_file
+from ..utils import load_json
 from ..utils import unique_values
 from .manager import NetworkSession
 from .manager import Response
 
 _ENDPOINT_PATH: Final[Path] = HI_RESOURCE_PATH / 'wp_endpoint_hosts.json'
 _ETAG_PATH: Final[Path] = HI_CACHE_PATH / 'etags.json'
+# Kept outside HI_CACHE_PATH, so the found paths never show up in the cache explorer
+_LINKS_PATH: Final[Path] = Path.home() / '.cache/hi_getter_links'
+_RETRY_BACKOFF: Final[float] = 0.3
+
+# Static headers sent to the API host. The Host header is added per Client.
+_API_HEADERS: Final[MappingProxyType[str, str]] = MappingProxyType({
+    'Accept': 'application/json, text/plain, */*',
+    # 'Accept-Encoding': 'gzip, deflate, br',
+    'Accept-Language': 'en-US',
+    'Connection': 'keep-alive',
+    'Cache-Control': 'no-cache',
+    'DNT': '1',
+    'Origin': 'https://www.halowaypoint.com',
+    'Pragma': 'no-cache',
+    'Referer': 'https://www.halowaypoint.com/',
+    'Sec-Fetch-Dest': 'empty',
+    'Sec-Fetch-Mode': 'cors',
+    'Sec-Fetch-Site': 'same-site',
+    'Sec-GPC': '1',
+    'TE': 'trailers',
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:110.0) Gecko/20100101 Firefox/110.0',
+})
+
+# Headers which override _API_HEADERS when navigating to the Halo Waypoint website.
+_WEB_HEADERS: Final[MappingProxyType[str, str]] = MappingProxyType({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+})
+_RETRY_STATUS_CODES: Final[frozenset[int]] = frozenset({500, 502, 503, 504})
 
 
 def cached_etags() -> dict[str, Any]:
@@ -48,7 +85,7 @@ def cached_etags() -> dict[str, Any]:
     etags: dict[str, Any] = {}
 
     try:
-        etags = json.loads(data)
+        etags = load_json(data)
     except json.JSONDecodeError:
         if data:
             _ETAG_PATH.with_suffix('.malformed').write_bytes(data)
@@ -58,9 +95,35 @@ def cached_etags() -> dict[str, Any]:
     return etags
 
 
-def save_etags(etags: dict[str, Any]) -> int:
+def _read_key(path: Path) -> str | None:
+    """Read a stripped key from the given file, or None if the file does not exist."""
+    try:
+        return path.read_text(encoding='utf8').strip()
+    except FileNotFoundError:
+        return None
+
+
+def _read_cached(path: Path) -> bytes | None:
+    """Read the contents of a cached file, or None if it cannot be read (Usually because it does not exist)."""
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _stat_stamp(path: Path) -> str | None:
+    """Stamp a file with its modification time and size, or None if it does not exist or cannot be accessed."""
+    try:
+        stat: os.stat_result = path.stat()
+    except OSError:
+        return None
+
+    return f'{stat.st_mtime_ns}-{stat.st_size}'
+
+
+def save_etags(etags: dict[str, Any]) -> None:
     """Save dictionary representation of etags to ``_ETAGS_PATH``."""
-    return _ETAG_PATH.write_text(json.dumps(etags, indent=2))
+    dump_data(_ETAG_PATH, etags)
 
 
 class Client(QObject):
@@ -84,57 +147,61 @@ class Client(QObject):
 
         :keyword token: Token to authenticate self to 343 API.
         :keyword wpauth: Halo Waypoint authentication key, allows for creation of 343 auth tokens.
+        :keyword max_retries: Amount of times to retry a GET request that failed with a transient server error.
+        :keyword max_concurrent_searches: Amount of requests a recursive search may have in progress at once.
+        :keyword requests_per_second: Maximum rate of API GET requests. Non-positive values disable rate limiting.
         """
         super().__init__(parent)
-        self.endpoints: dict[str, Any] = json.loads(_ENDPOINT_PATH.read_bytes())
+        self.endpoints: dict[str, Any] = load_json(_ENDPOINT_PATH.read_bytes())
         self.check_etags: bool = True
+        self.max_retries: int = kwargs.pop('max_retries', 3)
+        self.max_concurrent_searches: int = kwargs.pop('max_concurrent_searches', 8)
+        self.rate_limiter: TokenBucket = TokenBucket(kwargs.pop('requests_per_second', 10.0))
+        self._auth_callbacks: list[Callable[[], Any]] = []
         self._auth_in_progress: bool = False
+        self._draining_search_queue: bool = False
         self._emit_received_signals: bool = True
+        self._image_queue: deque[tuple[str, bool, bool]] = deque()  # Searched after _search_queue
+        self._os_roots: dict[Path, Path] = {}  # Cached to_os_path roots, cleared when host is set
         self._recursive_calls_in_progress: int = 0
+        self._search_queue: deque[tuple[str, bool, bool]] = deque()  # (path, recursive, emit_signals)
+        self._searches_in_flight: int = 0
+        self._unsaved_keys: dict[Path, str] = {}  # Key files to write on the next _save_keys call
+
+        # Token refreshes may change both keys at once, so save them together after a short delay
+        self._save_keys_timer: QTimer = QTimer(self)
+        self._save_keys_timer.setSingleShot(True)
+        self._save_keys_timer.setInterval(500)
+        self._save_keys_timer.timeout.connect(self._save_keys)  # pyright: ignore[reportGeneralTypeIssues]
+        atexit.register(self._save_keys)
 
         self.etags: dict[str, Any] = cached_etags()
         self.parent_path: str = '/hi/'
-        self.sub_host: str = self.endpoints['endpoints']['gameCmsService']['subdomain']
+        self.sub_host: str
+        self._api_root: str       # Built by the host setter
+        self._host: str           # Built by the host setter
+        self._parent_prefix: str  # Built by the host setter
+        self.host = self.endpoints['endpoints']['gameCmsService']['subdomain']
         self.searched_paths: set[str] = set()
         self.finishedSearch.connect(self._on_finished_search)
 
         self._token: str | None = kwargs.pop('token', os.getenv('HI_SPARTAN_AUTH', None))
-        if self._token is None and HI_TOKEN_PATH.is_file():
-            self._token = HI_TOKEN_PATH.read_text(encoding='utf8').strip()
+        if self._token is None:
+            self._token = _read_key(HI_TOKEN_PATH)
 
         self._wpauth: str | None = kwargs.pop('wpauth', os.getenv('HI_WAYPOINT_AUTH', None))
-        if self._wpauth is None and HI_WPAUTH_PATH.is_file():
-            self._wpauth = HI_WPAUTH_PATH.read_text(encoding='utf8').strip()
+        if self._wpauth is None:
+            self._wpauth = _read_key(HI_WPAUTH_PATH)
 
         self.api_session: NetworkSession = NetworkSession(self)
-        self.api_session.headers = CaseInsensitiveDict({
-            'Accept': ', '.join(('application/json', 'text/plain', '*/*')),
-            # 'Accept-Encoding': ', '.join(('gzip', 'deflate', 'br')),
-            'Accept-Language': 'en-US',
-            'Connection': 'keep-alive',
-            'Cache-Control': 'no-cache',
-            'DNT': '1',
-            'Host': self.host,
-            'Origin': 'https://www.halowaypoint.com',
-            'Pragma': 'no-cache',
-            'Referer': 'https://www.halowaypoint.com/',
-            'Sec-Fetch-Dest': 'empty',
-            'Sec-Fetch-Mode': 'cors',
-            'Sec-Fetch-Site': 'same-site',
-            'Sec-GPC': '1',
-            'TE': 'trailers',
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:110.0) Gecko/20100101 Firefox/110.0',
-        })
+        self.api_session.headers = CaseInsensitiveDict(_API_HEADERS | {'Host': self.host})
+        # Open the HTTP/2 connection ahead of time, so all API requests are multiplexed over it
+        self.api_session.preconnect(self.host)
+
         self.web_session: NetworkSession = NetworkSession(self)
-        self.web_session.headers = self.api_session.headers | {
-            'Accept': ','.join(('text/html', 'application/xhtml+xml', 'application/xml;q=0.9',
-                                'image/avif', 'image/webp', '*/*;q=0.8')),
-            'Host': self.endpoints['webHost'],
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Sec-Fetch-User': '?1',
-        }
+        self.web_session.headers = CaseInsensitiveDict(
+            _API_HEADERS | _WEB_HEADERS | {'Host': self.endpoints['webHost']}
+        )
 
         if self.wpauth:
             self.set_cookie('wpauth', self.wpauth)
@@ -149,25 +216,34 @@ class Client(QObject):
              path: str,
              update_auth_on_401: bool = True,
              finished: Callable[[Response], None] | None = None,
+             attempt: int = 0,
              **kwargs
              ) -> None:
         """Get a :py:class:`Response` from HaloWaypoint.
 
+        Requests are delayed to follow the ``rate_limiter``, and transient server errors
+        are retried with an exponential backoff, up to ``max_retries`` times.
+
         :param path: path to append to the API root.
         :param update_auth_on_401: run self._refresh_auth if response status code is 401 Unauthorized.
         :param finished: Callback to send finished request to.
+        :param attempt: Amount of previous attempts made for this request.
         """
-
         def handle_reply(response: Response):
-            if not response.code or response.headers.get('Content-Type') is not None and not response.data:
-                print(f'COULDNT GET {response.url.toDisplayString()} {response.get_internal_error()}')
+            if response.code in _RETRY_STATUS_CODES and attempt < self.max_retries:
+                print(f'RETRYING [{response.code}] {response.url.toDisplayString()}')
+                QTimer.singleShot(int(_RETRY_BACKOFF * 2 ** attempt * 1000), DeferredCallable(
+                    self._get, path, update_auth_on_401, finished, attempt + 1, _call_funcs=False, **kwargs
+                ))
                 return
 
             if not response.ok:
                 # Handle errors
                 if response.code == 401 and update_auth_on_401 and self.wpauth is not None:
-                    self.refresh_auth()
-                    self._get(path, False, finished, **kwargs)
+                    # Retry once, after the new token is received
+                    self.refresh_auth(finished=DeferredCallable(
+                        self._get, path, False, finished, _call_funcs=False, **kwargs
+                    ))
                 elif finished is not None:
                     # Send ERR response to the given consumer
                     finished(response)
@@ -176,7 +252,15 @@ class Client(QObject):
                 # Send OK response to the given consumer
                 finished(response)
 
-        self.api_session.get(self.api_root + path.strip(), finished=handle_reply, **kwargs)
+        url: str = self.api_root + path.strip()
+
+        # Reserve a request from the rate limiter, and send it once the reservation is due
+        if delay := self.rate_limiter.acquire():
+            QTimer.singleShot(math.ceil(delay * 1000), DeferredCallable(
+                self.api_session.get, url, finished=handle_reply, _call_funcs=False, **kwargs
+            ))
+        else:
+            self.api_session.get(url, finished=handle_reply, **kwargs)
 
     def _check_etag(self,
                     path: str,
@@ -189,8 +273,9 @@ class Client(QObject):
                 return
 
             if response.code == 401 and update_auth_on_401 and self.wpauth is not None:
-                self.refresh_auth()
-                self._check_etag(path, False, consumer, **kwargs)
+                self.refresh_auth(finished=DeferredCallable(
+                    self._check_etag, path, False, consumer, _call_funcs=False, **kwargs
+                ))
                 return
 
             path_key: str = f'{self.host}{self.parent_path}{path}'.lower()
@@ -200,13 +285,21 @@ class Client(QObject):
             # If there is a new version available, and we have an old version, download the new version.
             # and cache the old version in a separate directory.
             # If we don't an old version, assume the new version is currently being downloaded by get_hi_data.
-            if is_new_version and (cached_path := self.to_os_path(path)).is_file():
+            if is_new_version:
+                cached_path: Path = self.to_os_path(path)
                 archive_path: Path = self.to_os_path(path, parent=HI_CACHE_PATH / 'old_files').with_stem(
                     f'{cached_path.stem}_etag+{quote(etag, safe="")}'
                 )
-                archive_path.parent.mkdir(parents=True, exist_ok=True)
-                archive_path.write_bytes(cached_path.read_bytes())
-                cached_path.unlink()
+
+                # Move the old version instead of copying it, only checking the file system if that fails
+                try:
+                    os.replace(cached_path, archive_path)
+                except FileNotFoundError:
+                    if not cached_path.is_file():
+                        return
+
+                    archive_path.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(cached_path, archive_path)
 
                 self.get_hi_data(path, consumer, check_etag_override=False)
 
@@ -218,36 +311,156 @@ class Client(QObject):
         :param data: JSON data to search through for paths.
         :param recursive: Whether to start recursively searching.
         """
-        for value in unique_values(data):
-            if isinstance(value, str) and (match := HI_PATH_PATTERN.match(value)):
-                new_path: str = self.normalize_search_path(match[0])
-
-                if not recursive:
-                    self.get_hi_data(
-                        new_path,
-                        consumer=DeferredCallable(save_etags, self.etags),
-                        emit_signals=self._emit_received_signals
-                    )
-                    continue
+        if recursive:
+            self._queue_paths(self._find_paths(data))
+            return
+
+        for new_path in self._find_paths(data):
+            self.get_hi_data(
+                new_path,
+                consumer=DeferredCallable(save_etags, self.etags),
+                emit_signals=self._emit_received_signals
+            )
+
+    def _find_paths(self, data: dict[str, Any]) -> list[str]:
+        """Find the normalized resource paths in JSON data.
+
+        :param data: JSON data to search through for paths.
+        """
+        return [
+            self.normalize_search_path(match[0]) for value in unique_values(data)
+            if isinstance(value, str) and (match := HI_PATH_PATTERN.match(value))
+        ]
+
+    def _links_path(self, path: str) -> Path:
+        """Translate a given GET path to the location of the paths found in its cached file.
+
+        :param path: path to translate.
+        """
+        os_path: Path = self.to_os_path(path, parent=_LINKS_PATH)
+        return os_path.with_name(f'{os_path.name}.links')
+
+    def _read_links(self, path: str) -> list[str] | None:
+        """Read the paths previously found in the cached file of the given path.
+
+        :param path: path to read the found paths of.
+        :return: The found paths, or None if the file isn't cached or has changed since its paths were stored.
+        """
+        if (stamp := _stat_stamp(self.to_os_path(path))) is None:
+            return None
+        if (links := _read_cached(self._links_path(path))) is None:
+            return None
+
+        stored_stamp, _, found_paths = links.decode('utf8').partition('\n')
+        if stored_stamp != stamp:
+            return None
+
+        return found_paths.split('\n') if found_paths else []
+
+    def _store_links(self, path: str, found_paths: list[str]) -> None:
+        """Store the paths found in the cached file of the given path, keyed by the file's modification time and size.
+
+        :param path: path the paths were found in.
+        :param found_paths: Paths found in the cached file.
+        """
+        if (stamp := _stat_stamp(self.to_os_path(path))) is not None:
+            dump_data(self._links_path(path), '\n'.join([stamp, *found_paths]))
+
+    def _queue_paths(self, found_paths: list[str]) -> None:
+        """Queue unsearched paths to be recursively searched, then start as many as allowed.
+
+        :param found_paths: Normalized paths to queue.
+        """
+        for new_path in found_paths:
+            if new_path in self.searched_paths:
+                continue
+
+            self.searched_paths.add(new_path)
+
+            # If it's an image, download it then ignore the result
+            if new_path.rpartition('.')[2] in SUPPORTED_IMAGE_EXTENSIONS:
+                self._image_queue.append((new_path, False, self._emit_received_signals))
+
+            # Otherwise, start the process over again
+            else:
+                self._increment_counter()
+                self._search_queue.append((new_path, True, self._emit_received_signals))
 
-                # If it's an image, download it then ignore the result
-                if match['file_name'].split('.')[-1].lower() in SUPPORTED_IMAGE_EXTENSIONS:
-                    if new_path in self.searched_paths:
-                        continue
+        # Start all found paths at once, so sibling downloads run concurrently
+        self._drain_search_queue()
 
-                    self.searched_paths.add(new_path)
-                    self.get_hi_data(
-                        new_path,
-                        emit_signals=self._emit_received_signals
-                    )
+    def _queue_search(self, path: str, recursive: bool) -> None:
+        """Queue a path to be downloaded once the amount of searches in progress is below the limit.
 
-                # Otherwise, start the process over again
+        :param path: Path to download.
+        :param recursive: Whether to search the downloaded data for more paths.
+        """
+        self._search_queue.append((path, recursive, self._emit_received_signals))
+        self._drain_search_queue()
+
+    def _drain_search_queue(self) -> None:
+        """Start queued searches until ``max_concurrent_searches`` are in progress.
+
+        JSON files are started before images, as they may contain more paths to search.
+        Cached paths finish synchronously, so nested calls return early and leave the work to the outermost call.
+        """
+        if self._draining_search_queue:
+            return
+
+        self._draining_search_queue = True
+        try:
+            while self._searches_in_flight < self.max_concurrent_searches:
+                if self._search_queue:
+                    path, recursive, emit_signals = self._search_queue.popleft()
+                elif self._image_queue:
+                    path, recursive, emit_signals = self._image_queue.popleft()
                 else:
-                    if new_path in self.searched_paths:
-                        continue
+                    break
+
+                # Check for new versions here instead of in get_hi_data,
+                # so that the search consumer is only ever called once per path
+                if self.check_etags and self.to_os_path(path).is_file():
+                    self._check_etag(path, consumer=self._search_json, timeout=0)
+
+                # Skip searching cached files whose paths were already found
+                if recursive and (found_paths := self._read_links(path)) is not None:
+                    print(f'READING {path}')
+                    # Only parse the cached file if its data is emitted
+                    if emit_signals and (cached_data := _read_cached(self.to_os_path(path))) is not None:
+                        self.receivedJson.emit(path, load_json(cached_data))
+
+                    self._queue_paths(found_paths)
+                    self._decrement_counter()
+                    continue
 
-                    self.searched_paths.add(new_path)
-                    self.recursive_search(new_path)
+                self._searches_in_flight += 1
+                self.get_hi_data(
+                    path,
+                    consumer=self.handle_recursive_data if recursive else self._handle_search_leaf,
+                    emit_signals=emit_signals,
+                    check_etag_override=False,
+                    store_only=not (recursive or emit_signals)
+                )
+        finally:
+            self._draining_search_queue = False
+
+    def _handle_search_leaf(self, *_) -> None:
+        """Free the search slot of a finished download."""
+        self._searches_in_flight -= 1
+        self._drain_search_queue()
+
+    def _search_json(self, path: str, data: dict[str, Any] | bytes | int) -> None:
+        """Queue the paths found in JSON data, storing them for the next search of the given path.
+
+        :param path: Path data is from.
+        :param data: Data received from path. If not JSON, return early.
+        """
+        if isinstance(data, dict):
+            # Iterate over all values in the JSON data
+            # This process ignores already-searched values
+            found_paths: list[str] = self._find_paths(data)
+            self._store_links(path, found_paths)
+            self._queue_paths(found_paths)
 
     def _increment_counter(self):
         self._recursive_calls_in_progress += 1
@@ -264,6 +477,14 @@ class Client(QObject):
         self.searched_paths.clear()
         save_etags(self.etags)
 
+    def _save_keys(self) -> None:
+        """Write changed token and wpauth values to their hidden files."""
+        while self._unsaved_keys:
+            path, key = self._unsaved_keys.popitem()
+            hide_windows_file(path, unhide=True)
+            path.write_bytes(key.encode('utf8'))
+            hide_windows_file(path)
+
     def _store_etag(self, path: str, etag: str):
         path_key: str = f'{self.host}{self.parent_path}{path}'.lower()
         path_etags: list[str] = self.etags.get('paths', {}).get(path_key, {}).get('etags', [])
@@ -287,7 +508,8 @@ class Client(QObject):
                     path: str,
                     consumer: Callable[[str, dict[str, Any] | bytes | int], None] | None = None,
                     emit_signals: bool = True,
-                    check_etag_override: bool | None = None
+                    check_etag_override: bool | None = None,
+                    store_only: bool = False
                     ) -> None:
         """Get a resource hosted on the HaloWaypoint API.
 
@@ -297,6 +519,8 @@ class Client(QObject):
         :param consumer: Consumer to send received data to.
         :param emit_signals: Whether to emit received* signals.
         :param check_etag_override: Whether to call ``_check_etag`` if path is already cached.
+        :param store_only: Whether images are only stored in the cache, without being read from it.
+            If so, image data is not emitted, and the consumer receives empty bytes instead.
         :raises ValueError: If the response is not JSON or a supported image type.
         """
         check_etags = self.check_etags
@@ -305,39 +529,69 @@ class Client(QObject):
 
         path = self.normalize_search_path(path)
         os_path: Path = self.to_os_path(path)
+        is_image: bool = path.rpartition('.')[2] in SUPPORTED_IMAGE_EXTENSIONS
+
+        # Stored images are never read, so only check if they are already cached.
+        # Otherwise, read the cached file directly, instead of checking if it exists first
+        cached_data: bytes | None = (
+            (b'' if os_path.is_file() else None) if store_only and is_image else _read_cached(os_path)
+        )
 
-        if not os_path.is_file():
+        if cached_data is None:
             def handle_reply(response: Response):
-                if response.code and not response.ok:
-                    print(f'ERROR [{response.code}] for {path} ')
-                    if emit_signals:
+                # Network failures have no status code, so they are only sent to the consumer
+                if not response.ok:
+                    print(f'ERROR [{response.code or response.get_internal_error()}] for {path} ')
+                    if emit_signals and response.code:
                         self.receivedError.emit(path, response.code)
                     if consumer is not None:
-                        consumer(path, response.code)
+                        consumer(path, response.code or 0)
+                    return
+
+                # A successful response without a body is not an error, but there is nothing to cache
+                if not response.data:
+                    print(f'EMPTY [{response.code}] for {path} ')
+                    if consumer is not None:
+                        consumer(path, b'')
                     return
 
-                content_type: str | None = response.headers.get('Content-Type')
+                # Parse the MIME type once, ignoring parameters such as charset
+                content_type: str = response.headers.get('Content-Type') or ''
+                mime_type: str = content_type.partition(';')[0].strip().lower()
                 response_data: dict[str, Any] | bytes
 
                 if etag := response.headers.get('ETag', '').strip('"'):
                     self._store_etag(path, etag)
 
-                if not content_type:
-                    raise ValueError('Successful status code but no Content-Type header.')
-
-                if 'json' in content_type:
-                    response_data = response.json
-                    if emit_signals:
-                        self.receivedJson.emit(path, response_data)
-                elif content_type in SUPPORTED_IMAGE_MIME_TYPES:
-                    response_data = response.data
-                    if emit_signals:
-                        self.receivedData.emit(path, response_data)
-                else:
-                    raise ValueError(f'Unsupported content type received: {content_type}')
+                try:
+                    if not mime_type:
+                        raise ValueError('Successful status code but no Content-Type header.')
+
+                    if mime_type.endswith('json'):
+                        response_data = response.json
+                        if emit_signals:
+                            self.receivedJson.emit(path, response_data)
+
+                        print(f'DOWNLOADED {path} >>> {content_type}')
+                        dump_data(os_path, response_data)
+
+                    elif mime_type in SUPPORTED_IMAGE_MIME_TYPES:
+                        # Stored images are not emitted, and the consumer receives empty bytes instead
+                        response_data = b'' if store_only else response.data
+                        if emit_signals and not store_only:
+                            self.receivedData.emit(path, response_data)
+
+                        print(f'DOWNLOADED {path} >>> {content_type}')
+                        dump_data(os_path, response.data)
+
+                    else:
+                        raise ValueError(f'Unsupported content type received: {content_type}')
+                except ValueError:
+                    # Call the consumer before reporting the error, as it may be holding a search slot
+                    if consumer is not None:
+                        consumer(path, response.code or 0)
+                    raise
 
-                print(f'DOWNLOADED {path} >>> {content_type}')
-                dump_data(os_path, response_data)
                 if consumer is not None:
                     consumer(path, response_data)
 
@@ -348,12 +602,13 @@ class Client(QObject):
                 self._check_etag(path, consumer=consumer, timeout=0)
 
             print(f'READING {path}')
-            data: dict[str, Any] | bytes = os_path.read_bytes()
-            if os_path.suffix.lstrip('.') in SUPPORTED_IMAGE_EXTENSIONS:
-                self.receivedData.emit(path, data)
+            data: dict[str, Any] | bytes = cached_data
+            if is_image:
+                if not store_only:
+                    self.receivedData.emit(path, data)
             else:
                 # Assume json if not an image
-                data = json.loads(data.decode(encoding=guess_json_utf(data) or 'utf8'))
+                data = load_json(data)
                 self.receivedJson.emit(path, data)
 
             if consumer is not None:
@@ -362,15 +617,17 @@ class Client(QObject):
     def recursive_search(self, path: str) -> None:
         """Get a file and recursively look through its contents for paths.
 
+        Requests are queued, so that at most ``max_concurrent_searches`` are in progress at once.
+
         :param path: Path to search.
         """
+        # Mark the path as visited before it is downloaded, so it is never queued again by its own results
+        path = self.normalize_search_path(path)
+        self.searched_paths.add(path)
+
         self._emit_received_signals = False
         self._increment_counter()
-        self.get_hi_data(
-            path,
-            consumer=self.handle_recursive_data,
-            emit_signals=self._emit_received_signals
-        )
+        self._queue_search(path, recursive=True)
 
     def start_handle_json(self, data: dict[str, Any], recursive: bool = False):
         """Look through JSON data for resource paths.
@@ -394,15 +651,9 @@ class Client(QObject):
         :param path: Path data is from.
         :param data: Data received from path. If not JSON, return early.
         """
-        # This set is shared between all recursive calls, so no duplicate searches should occur
-        self.searched_paths.add(path)
-
-        if isinstance(data, dict):
-            # Iterate over all values in the JSON data
-            # This process ignores already-searched values
-            self._handle_json(data, recursive=True)
-
+        self._search_json(path, data)
         self._decrement_counter()
+        self._handle_search_leaf()
 
     def hidden_key(self) -> str:
         """:return: The first and last 3 characters of the waypoint token, seperated by periods."""
@@ -423,12 +674,11 @@ class Client(QObject):
         """
         # Ensure lowercase
         path = path.lower().strip().lstrip('/')
-        parent_path = self.parent_path.lower().lstrip('/')
-        file_ext = path.split('.')[-1]
+        file_ext = path.rpartition('.')[2]
 
         # Expand paths
-        if path.startswith(parent_path):
-            path = path.removeprefix(parent_path)
+        if path.startswith(self._parent_prefix):
+            path = path.removeprefix(self._parent_prefix)
         elif not path.startswith('images/file/') and (file_ext in SUPPORTED_IMAGE_EXTENSIONS):
             path = f'images/file/{path}'
         elif not path.startswith('progression/file/') and (file_ext == 'json'):
@@ -444,7 +694,11 @@ class Client(QObject):
         :param path: path to translate.
         :param parent: OS path to use as parent directory.
         """
-        return parent / self.sub_host.replace('-', '_') / self.parent_path.strip('/') / path
+        # The host-specific root only changes with the host, so build it once per parent
+        if (root := self._os_roots.get(parent)) is None:
+            root = self._os_roots[parent] = parent / self.sub_host.replace('-', '_') / self.parent_path.strip('/')
+
+        return root / path
 
     def to_get_path(self, path: Path) -> str:
         """Translate a given cache location to the equivalent GET path.
@@ -458,20 +712,28 @@ class Client(QObject):
 
         return resource
 
-    def refresh_auth(self) -> None:
+    def refresh_auth(self, finished: Callable[[], Any] | None = None) -> None:
         """Refresh authentication to Halo Waypoint servers.
 
         wpauth MUST have a value for this to work. A lone 343 spartan token is not enough to generate a new one.
+
+        :param finished: Callback to run after the refresh finishes.
+            If a refresh is already in progress, it is run after that refresh instead.
         """
         print('REFRESHING AUTH')
 
+        if finished is not None:
+            self._auth_callbacks.append(finished)
+
         if self._auth_in_progress:
             return
         self._auth_in_progress = True
 
         def handle_reply(_: Response):
-            wpauth: str = decode_url(self.web_session.cookies.get('wpauth') or '')
-            token: str = decode_url(self.web_session.cookies.get('343-spartan-token') or '')
+            # Each access of cookies converts the whole cookie jar, so only do it once
+            cookies: dict[str, str] = self.web_session.cookies
+            wpauth: str = decode_url(cookies.get('wpauth') or '')
+            token: str = decode_url(cookies.get('343-spartan-token') or '')
 
             if wpauth and self.wpauth != wpauth:
                 self.wpauth = wpauth
@@ -480,6 +742,10 @@ class Client(QObject):
 
             self._auth_in_progress = False
 
+            callbacks, self._auth_callbacks = self._auth_callbacks, []
+            for callback in callbacks:
+                callback()
+
         self.web_session.get('https://www.halowaypoint.com/', finished=handle_reply)
 
     def delete_cookie(self, name: str) -> None:
@@ -504,13 +770,16 @@ class Client(QObject):
         if (key_start_index := value.find('v4=')) == -1:
             raise ValueError('token value is missing version identifier ("v4=") to signify start.')
 
-        self._token = value[key_start_index:].rstrip()
+        # Skip the cookie, header, and file updates if the token is unchanged
+        if (value := value[key_start_index:].rstrip()) == self._token:
+            return
+
+        self._token = value
         self.set_cookie('343-spartan-token', self._token)
         self.api_session.headers['x-343-authorization-spartan'] = self._token
 
-        hide_windows_file(HI_TOKEN_PATH, unhide=True)
-        HI_TOKEN_PATH.write_text(self._token, encoding='utf8')
-        hide_windows_file(HI_TOKEN_PATH)
+        self._unsaved_keys[HI_TOKEN_PATH] = self._token
+        self._save_keys_timer.start()
 
     @token.deleter
     def token(self) -> None:
@@ -518,8 +787,8 @@ class Client(QObject):
         self.delete_cookie('343-spartan-token')
         if 'x-343-authorization-spartan' in self.api_session.headers:
             self.api_session.headers.pop('x-343-authorization-spartan')
-        if HI_TOKEN_PATH.is_file():
-            HI_TOKEN_PATH.unlink()
+        self._unsaved_keys.pop(HI_TOKEN_PATH, None)
+        HI_TOKEN_PATH.unlink(missing_ok=True)
 
     @property
     def wpauth(self) -> str | None:
@@ -529,30 +798,36 @@ class Client(QObject):
     @wpauth.setter
     def wpauth(self, value: str) -> None:
         value = decode_url(value)
-        self._wpauth = value.split(':')[-1].strip()
+        if (value := value.split(':')[-1].strip()) == self._wpauth:
+            return
+
+        self._wpauth = value
         self.set_cookie('wpauth', self._wpauth)
 
-        hide_windows_file(HI_WPAUTH_PATH, unhide=True)
-        HI_WPAUTH_PATH.write_text(self._wpauth, encoding='utf8')
-        hide_windows_file(HI_WPAUTH_PATH)
+        self._unsaved_keys[HI_WPAUTH_PATH] = self._wpauth
+        self._save_keys_timer.start()
 
     @wpauth.deleter
     def wpauth(self) -> None:
         self._wpauth = None
         self.delete_cookie('wpauth')
-        if HI_WPAUTH_PATH.is_file():
-            HI_WPAUTH_PATH.unlink()
+        self._unsaved_keys.pop(HI_WPAUTH_PATH, None)
+        HI_WPAUTH_PATH.unlink(missing_ok=True)
 
     @property
     def api_root(self) -> str:
         """Root of sent API requests."""
-        return f'https://{self.host}{self.parent_path}'
+        return self._api_root
 
     @property
     def host(self) -> str:
         """Host to send to."""
-        return f'{self.sub_host}.{self.endpoints["svcHost"]}'
+        return self._host
 
     @host.setter
     def host(self, value: str) -> None:
         self.sub_host = value
+        self._host = f'{value}.{self.endpoints["svcHost"]}'
+        self._api_root = f'https://{self._host}{self.parent_path}'
+        self._parent_prefix = self.parent_path.lower().lstrip('/')
+        self._os_roots.clear()
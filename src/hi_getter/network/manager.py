@@ -13,7 +13,6 @@ __all__ = (
 )
 
 import datetime as dt
-import json as json_
 import re
 from collections.abc import Callable
 from collections.abc import Mapping
@@ -34,8 +33,8 @@ from ..models import CaseInsensitiveDict
 from ..models import DeferredCallable
 from ..utils import dict_to_query
 from ..utils import encode_url_params
-from ..utils import guess_json_utf
 from ..utils import is_error_status
+from ..utils import load_json
 from ..utils import query_to_dict
 from ..utils import wait_for_reply
 
@@ -298,6 +297,23 @@ class NetworkSession:
         cookie.setPath(path or '/')
         return self.manager.cookieJar().insertCookie(cookie)
 
+    def preconnect(self, host: str, port: int = 443, http2: bool = True) -> None:
+        """Open an encrypted connection to the given host ahead of time, so later requests can reuse it.
+
+        :param host: Host to connect to.
+        :param port: Port to connect to.
+        :param http2: Whether to negotiate HTTP/2, which multiplexes all requests to the host over one connection.
+        """
+        ssl_config = QSslConfiguration.defaultConfiguration()
+        if http2:
+            # PySide exposes the protocol names as str, but only accepts them as QByteArray
+            ssl_config.setAllowedNextProtocols([
+                QByteArray(QSslConfiguration.ALPNProtocolHTTP2.encode()),
+                QByteArray(QSslConfiguration.NextProtocolHttp1_1.encode())
+            ])
+
+        self.manager.connectToHostEncrypted(host, port, ssl_config)
+
     def request(self, method: str, url: QUrl | str, *args, **kwargs) -> Response:
         """Send an HTTP request to the given URL with the given data.
 
@@ -713,6 +729,10 @@ class Request:
         return _response
 
     def _prepare_ssl(self) -> None:
+        # Requests already use the default configuration, so only build one if it is customized
+        if not (isinstance(self.verify, str) or self.cert):
+            return
+
         ssl_config = QSslConfiguration.defaultConfiguration()
 
         if isinstance(self.verify, str):
@@ -751,12 +771,15 @@ class Request:
         """
         request_url = QUrl(self.url)  # Ensure url is of type QUrl
         request_params = query_to_dict(request_url.query()) | self.params  # Update QUrl params with params argument
-        request_headers = session.headers | self.headers                   # Use session headers as default headers
-        request_cookies = session.cookies | self.cookies                   # Use session cookies as default cookies
+        request_headers = session.headers                                  # Use session headers as default headers
         request_data = self._prepare_body()
 
+        # Only copy the session headers if this request modifies them
+        if self.headers or self.cookies or self.stream:
+            request_headers = request_headers | self.headers
+
         if self.cookies:
-            request_headers['Cookie'] = request_cookies
+            request_headers['Cookie'] = session.cookies | self.cookies     # Use session cookies as default cookies
 
         request_url.setQuery(dict_to_query(request_params))
         self._request.setUrl(request_url)
@@ -890,11 +913,12 @@ class Response:
             if (name := raw_name.toStdString()) not in self._headers:
                 value: bool | int | str
                 string_val: str = raw_value.toStdString()
+                lower_val: str = string_val.lower()
 
-                if string_val.lower() == 'true':
+                if lower_val == 'true':
                     value = True
 
-                elif string_val.lower() == 'false':
+                elif lower_val == 'false':
                     value = False
 
                 # Possible bug here, regex match vs fullmatch
@@ -911,11 +935,7 @@ class Response:
     @property
     def json(self) -> dict[str, Any]:
         """Return the :py:class:`Response` data as a ``JSON`` object."""
-        data: bytes = self.data
-        if (encoding := self.encoding) is None:
-            encoding = guess_json_utf(data) or 'utf8'
-
-        return json_.loads(data.decode(encoding=encoding))
+        return load_json(self.data)
 
     @property
     def ok(self) -> bool:
@@ -30,6 +30,7 @@ __all__ = (
     'init_layouts',
     'init_objects',
     'is_error_status',
+    'load_json',
     'patch_windows_taskbar_icon',
     'patch_incompatible_pywin32_shibokensupport__mod_uses_pyside',
     'query_to_dict',
@@ -62,6 +63,7 @@ from .network import encode_url_params
 from .network import guess_json_utf
 from .network import http_code_map
 from .network import is_error_status
+from .network import load_json
 from .network import query_to_dict
 from .network import wait_for_reply
 from .package import current_requirement_licenses
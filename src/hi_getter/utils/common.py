@@ -22,6 +22,11 @@ from types import TracebackType
 from typing import TypeVar
 from weakref import ProxyType
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _PT = TypeVar('_PT')
 
 
@@ -31,29 +36,42 @@ def bit_rep(__bool: bool, /) -> str:
 
 
 def dump_data(path: Path | str, data: bytes | dict | str, encoding: str | None = None) -> None:
-    """Dump data to path as a file."""
+    """Dump data to path as a file.
+
+    Data is written to a temporary file which then replaces ``path``, so an interrupted write never leaves
+    a partial file behind. If ``path`` already contains the same data, it is left untouched.
+    """
     import json
     import os
 
     default_encoding = 'utf8'
     path = Path(path)
-    if not path.parent.exists():
-        os.makedirs(path.parent)
+    path.parent.mkdir(parents=True, exist_ok=True)
 
-    if isinstance(data, str):
-        # Write strings at text files
-        path.write_text(data, encoding=encoding or default_encoding)
-    elif isinstance(data, bytes):
-        # Decode bytes if provided with encoding, else write as data
-        if encoding is not None:
-            data = data.decode(encoding=encoding)
-            path.write_text(data, encoding=encoding)
+    if isinstance(data, dict):
+        # Write dictionaries as json files, serializing straight to bytes if orjson is installed
+        if orjson is not None:
+            data = orjson.dumps(data, option=orjson.OPT_INDENT_2)
         else:
-            path.write_bytes(data)
-    elif isinstance(data, dict):
-        # Write dictionaries as json files
-        with path.open(mode='w', encoding=encoding or default_encoding) as file:
-            json.dump(data, file, indent=2)
+            data = json.dumps(data, indent=2)
+
+    if isinstance(data, str):
+        # Write strings as text files
+        data = data.encode(encoding or default_encoding)
+    elif encoding is not None:
+        # Ensure bytes are valid in the given encoding, else write as data
+        data.decode(encoding=encoding)
+
+    # Skip writing if the file contents are identical
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return
+    except OSError:
+        pass
+
+    temp_path: Path = path.with_name(f'{path.name}.tmp')
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
 
 
 def format_tb(tb: TracebackType | None) -> str:
@@ -103,20 +121,24 @@ def return_arg(__arg: _PT, /) -> _PT:
 
 
 def unique_values(data: Iterable) -> set:
-    """Recursively get all values in any Iterables. For Mappings, ignore keys and only remember values.
+    """Get all values in any nested Iterables. For Mappings, ignore keys and only remember values.
+
+    Nested values are traversed with an explicit stack instead of recursion,
+    so deeply nested data does not hit the recursion limit.
 
     :return Set containing all unique non-iterable values.
     """
     new: set = set()
-    if isinstance(data, Mapping):
-        # Loop through Mapping values
-        for value in data.values():
-            new.update(unique_values(value))
-    elif isinstance(data, Iterable) and not isinstance(data, str):
-        # Loop through Iterable values
-        for value in data:
-            new.update(unique_values(value))
-    else:
-        # Finally, get value
-        new.add(data)
+    stack: list = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, Mapping):
+            # Loop through Mapping values
+            stack.extend(value.values())
+        elif isinstance(value, Iterable) and not isinstance(value, str):
+            # Loop through Iterable values
+            stack.extend(value)
+        else:
+            # Finally, get value
+            new.add(value)
     return new
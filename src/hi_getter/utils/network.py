@@ -12,30 +12,43 @@ __all__ = (
     'guess_json_utf',
     'http_code_map',
     'is_error_status',
+    'load_json',
     'query_to_dict',
     'wait_for_reply',
 )
 
 import codecs
+import json
 from http import HTTPStatus
+from typing import Any
+from typing import Final
 from urllib.parse import unquote as decode_url
 from urllib.parse import urlencode as encode_url_params
 
 from PySide6.QtCore import *
 from PySide6.QtNetwork import *
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Descriptions which replace the default HTTPStatus description for common error codes.
+_HTTP_CODE_DESCRIPTIONS: Final[dict[int, str]] = {
+    400: 'Your search path has malformed syntax or bad characters.',
+    401: 'No permission -- Your API token is most likely invalid.',
+    403: 'Request forbidden -- You cannot get this resource with or without an API token.',
+    404: 'No resource found at the given location.',
+    405: 'Invalid method -- GET requests are not accepted for this resource.',
+    406: 'Client does not support the given resource format.',
+}
+
+# Kept as a mutable dict, as descriptions are replaced with their translations at runtime.
 # pylint: disable=not-an-iterable
-http_code_map = {status.value: (status.phrase, status.description) for status in HTTPStatus}
-for _value, _description in {
-        400: 'Your search path has malformed syntax or bad characters.',
-        401: 'No permission -- Your API token is most likely invalid.',
-        403: 'Request forbidden -- You cannot get this resource with or without an API token.',
-        404: 'No resource found at the given location.',
-        405: 'Invalid method -- GET requests are not accepted for this resource.',
-        406: 'Client does not support the given resource format.',
-}.items():
-    http_code_map[_value] = (http_code_map[_value][0], _description)
-    del _value, _description
+http_code_map: dict[int, tuple[str, str]] = {
+    status.value: (status.phrase, _HTTP_CODE_DESCRIPTIONS.get(status.value, status.description))
+    for status in HTTPStatus
+}
 
 
 def dict_to_cookie_list(cookie_values: dict[str, str]) -> list[QNetworkCookie]:
@@ -71,6 +84,20 @@ def is_error_status(status: int) -> bool:
     return 400 <= status < 600
 
 
+def load_json(data: bytes | str) -> Any:
+    """Deserialize JSON data, detecting the encoding of bytes with :py:func:`guess_json_utf`.
+
+    If ``orjson`` is installed, it is used to parse UTF-8 bytes directly, without decoding them first.
+    """
+    if isinstance(data, bytes) and (encoding := guess_json_utf(data) or 'utf-8') != 'utf-8':
+        data = data.decode(encoding=encoding)
+
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
 def wait_for_reply(reply: QNetworkReply) -> None:
     """Process events until the reply is finished.
 
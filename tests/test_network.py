@@ -0,0 +1,23 @@
+###################################################################################################
+#                              MIT Licence (C) 2023 Cubicpath@Github                              #
+###################################################################################################
+"""Tests for the hi_getter.network package."""
+from __future__ import annotations
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+
+from hi_getter.network.manager import NetworkSession
+
+
+@pytest.fixture(scope='module')
+def application() -> QCoreApplication:
+    """QCoreApplication required by QNetworkAccessManager."""
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.mark.parametrize('http2', [True, False])
+def test_preconnect(application: QCoreApplication, http2: bool) -> None:
+    """Client.__init__ preconnects its API session, so this must never raise."""
+    session = NetworkSession(application)
+    session.preconnect('localhost', http2=http2)